@@ -1,8 +1,9 @@
 from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from typing import List, Optional
+import numpy as np
 
 @dataclass(slots=True)
 class PointFrame:
     ts_ms: Optional[int]                   # still available if you ever need it
-    coords: List[Tuple[float, float]]      # (x, y) pairs only
+    coords: np.ndarray                     # (N, 2) float64 — x, y per row
     extra:  List[str]                      # tokens after an optional “D,”
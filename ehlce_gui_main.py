@@ -1,5 +1,5 @@
 # ehlce_gui_main.py
-import sys, serial.tools.list_ports, pyqtgraph as pg
+import sys, multiprocessing, serial.tools.list_ports, pyqtgraph as pg
 from PySide6.QtWidgets import (
     QApplication, QDialog, QVBoxLayout, QHBoxLayout, QLabel, QComboBox,
     QLineEdit, QPushButton, QMessageBox
@@ -64,4 +64,5 @@ def main(argv=None):
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()      # reader runs in a child process
     main()
@@ -7,41 +7,30 @@ Plots show **only the last 10 seconds** of data.
 pip install pyqtgraph PySide6 pyserial numpy
 """
 
-import queue, bisect, serial, numpy as np, time, itertools
+import os, numpy as np, time, itertools, csv, warnings, multiprocessing as mp
 from pathlib import Path
-from typing  import Dict, List, Optional
+from typing  import Dict, List, Optional, Set
 
-from PySide6.QtCore    import Qt, Signal, QObject, QTimer
+from PySide6.QtCore    import Qt, QTimer, QSocketNotifier
 from PySide6.QtWidgets import (
     QWidget, QSplitter, QVBoxLayout, QHBoxLayout, QTextEdit, QLineEdit,
     QPushButton, QLabel, QTableWidget, QTableWidgetItem, QHeaderView,
-    QInputDialog, QFileDialog, QMessageBox, QListWidget, QListWidgetItem, QComboBox
+    QInputDialog, QFileDialog, QMessageBox, QListWidget, QListWidgetItem, QComboBox, QSpinBox
 )
 import pyqtgraph as pg
 
 from data          import PointFrame
-from serial_reader import SerialReader
+from serial_reader import reader_proc, unpack_batch
 
-_COLORS = itertools.cycle(['y', 'c', 'm', 'g', 'r', 'w'])  # curve colours
+_COLORS = ['y', 'c', 'm', 'g', 'r', 'w']  # curve colours, picked by column index
+_LOG_BUF, _LOG_FLUSH_EVERY = 64*1024, 100  # CSV file buffer (bytes) / flush period (frames)
+_FRAME_MS = 16                             # min. gap between GUI updates (~60 Hz)
+_SAFETY_MS = 250                           # POSIX: slow fallback pump if a wakeup is missed
 
 
-class _Bridge(QObject):
-    new_raw = Signal(str)
-    new_obj = Signal(object)
-
-
-class _RawReader(SerialReader):
-    def run(self):
-        buf = bytearray()
-        while not self._stop.is_set():
-            buf.extend(self._ser.read(self._ser.in_waiting or 1))
-            while b'\n' in buf:
-                line, _, buf = buf.partition(b'\n')
-                txt = line.decode('utf-8', 'replace').strip()
-                self._q.put(('raw', txt))
-                parsed = self._parse(txt)
-                if not isinstance(parsed, str):
-                    self._q.put(('obj', parsed))
+def _float_or_nan(tok:str)->float:
+    try: return float(tok)
+    except ValueError: return np.nan
 
 
 class SerialGui(QWidget):
@@ -50,26 +39,34 @@ class SerialGui(QWidget):
         super().__init__()
         self.setWindowTitle(f"Serial Data Logging — {port} @ {baud}")
 
-        # serial --------------------------------------------------------
-        try: self._ser = serial.Serial(port, baud, timeout=0.1)
-        except serial.SerialException as e: raise SystemExit(f"❌ {e}")
-
-        self._q = queue.Queue()
-        br = _Bridge(); br.new_raw.connect(lambda s: self._serial_in.append(s)); br.new_obj.connect(self._handle_obj)
-        self._bridge = br
-        self._reader = _RawReader(self._ser, self._q); self._reader.start()
+        # serial — reader process owns the port (parsing off our GIL) ---
+        self._rx, rx_send = mp.Pipe(duplex=False)         # reader → GUI, one batch per chunk
+        self._tx_q, self._stop = mp.Queue(), mp.Event()
+        self._reader = mp.Process(target=reader_proc, args=(port, baud, rx_send, self._tx_q, self._stop), daemon=True)
+        self._reader.start(); rx_send.close()              # child holds the only send end
 
         # state ---------------------------------------------------------
         self._conn_pairs, self._line_items = [], []
         self._labels, self._fixed_pts = [], []
+        self._fixed_arr = np.empty((0,2))                # _fixed_pts as (M, 2), rebuilt on add only
+        self._lbl_state: List[Optional[tuple]] = []   # last (text, x, y) pushed to each label
+        self._brush_red, self._brush_blue = pg.mkBrush('r'), pg.mkBrush('b')
+        self._brush_arr = np.empty(0, dtype=object)  # red for P1, blue for the rest
         self._custom_lbl: Dict[int,str] = {}
         self._lbl_color = "white"
         self._csv_pts: Optional[open] = None; self._csv_ex: Optional[open] = None
+        self._csv_w_pts = None; self._log_frames = 0
+        self._frame = PointFrame(ts_ms=None, coords=np.empty((0,2)), extra=[])  # refilled per incoming frame
 
-        self._ts_time:  List[float] = []
-        self._ts_data:  Dict[int, List[float]] = {}
+        # fixed-size ring buffers: one time array + one array per extra column
+        self._ts_cap, self._ts_pos, self._ts_count = 10000, 0, 0
+        self._ts_time:  np.ndarray             = np.empty(self._ts_cap, dtype=np.float64)
+        self._ts_data:  Dict[int, np.ndarray]  = {}
         self._ts_scale: Dict[int, float]       = {}
         self._ts_curves:Dict[int, pg.PlotDataItem] = {}
+        self._ts_mean_curves:Dict[int, pg.PlotDataItem] = {}   # dashed rolling-mean overlays
+        self._ts_dirty_cols: Set[int] = set()        # columns whose curve is stale
+        self._ts_dirty = False                        # replot on the next timer tick
 
         # XY plot -------------------------------------------------------
         self._plot = pg.PlotWidget(); self._plot.setAspectLocked(True)
@@ -89,13 +86,16 @@ class SerialGui(QWidget):
         self._tbl_ex.horizontalHeader().sectionDoubleClicked.connect(self._rename_ex_col)
 
         self._ts_list = QListWidget(maximumHeight=110)
-        self._ts_list.itemChanged.connect(self._refresh_ts_plot)
+        self._ts_list.itemChanged.connect(self._mark_ts_dirty)
         self._ts_list.itemDoubleClicked.connect(self._edit_scale)  # set multiplier
         self._ts_plot = pg.PlotWidget(minimumHeight=120); self._ts_plot.showGrid(x=True,y=True)
+        self._ts_plot.setDownsampling(auto=True,mode='peak'); self._ts_plot.setClipToView(True)  # ≤ ~1 sample per pixel
 
         # controls
         self._clr_combo = QComboBox(); self._clr_combo.addItems(['white','yellow','cyan','magenta'])
         self._clr_combo.currentTextChanged.connect(lambda c: [lab.setColor(c) for lab in self._labels] or setattr(self,'_lbl_color',c))
+        self._mean_spin = QSpinBox(minimum=0, maximum=1000, specialValueText="off")  # rolling-mean window (samples)
+        self._mean_spin.valueChanged.connect(lambda _: self._ts_dirty_cols.update(self._ts_data) or self._mark_ts_dirty())
 
         self._tx_entry = QLineEdit(); self._tx_entry.setPlaceholderText("Type text & Enter")
         self._tx_btn   = QPushButton("Send")
@@ -116,7 +116,7 @@ class SerialGui(QWidget):
         right.addWidget(QLabel("Last TX:"));         right.addWidget(self._last_tx)
         right.addWidget(self._tbl_pts); right.addWidget(self._tbl_ex)
         right.addWidget(QLabel("Plot columns (double-click to scale):")); right.addWidget(self._ts_list); right.addWidget(self._ts_plot)
-        right.addLayout(self._row(QLabel("Label colour:"), self._clr_combo))
+        right.addLayout(self._row(QLabel("Label colour:"), self._clr_combo, QLabel("Rolling mean:"), self._mean_spin))
         right.addLayout(self._row(self._tx_entry, self._tx_btn))
         right.addLayout(self._row(QLabel("Connect:"), self._conn_entry, self._add_conn, self._clr_conn))
         right.addLayout(self._row(QLabel("Add point:"), self._fix_entry, self._add_fix))
@@ -129,7 +129,13 @@ class SerialGui(QWidget):
 
         # signals / timer ----------------------------------------------
         self._tbl_pts.itemChanged.connect(self._tbl_label_edited)
-        self._timer=QTimer(self); self._timer.setInterval(50); self._timer.timeout.connect(self._pump); self._timer.start()
+        self._timer=QTimer(self); self._timer.timeout.connect(self._pump); self._last_pump=0.0
+        if os.name=='posix':   # pipe fd is selectable → wake only when the reader sent something
+            self._timer.setSingleShot(True)
+            self._rx_notify=QSocketNotifier(self._rx.fileno(),QSocketNotifier.Read,self); self._rx_notify.activated.connect(self._rx_ready)
+            self._safety=QTimer(self); self._safety.setInterval(_SAFETY_MS); self._safety.timeout.connect(self._schedule_pump); self._safety.start()
+        else:                  # Windows pipe handles can't be watched — poll at frame rate
+            self._rx_notify=None; self._timer.setInterval(_FRAME_MS); self._timer.start()
 
     # ---------- helper GUI builders -----------------------------------
     def _make_tbl(self,hdr,*,editable=False):
@@ -139,102 +145,156 @@ class SerialGui(QWidget):
         t.setHorizontalHeaderLabels(hdr); t.setMaximumHeight(150); return t
     def _row(self,*w): h=QHBoxLayout(); [h.addWidget(x) for x in w]; return h
 
-    # ---------- queue pump --------------------------------------------
+    # ---------- reader pump -------------------------------------------
+    def _rx_ready(self,*_):
+        self._rx_notify.setEnabled(False); self._schedule_pump()   # re-armed once drained
+    def _schedule_pump(self):
+        # run _pump now, or when _FRAME_MS has passed since the last one
+        if self._timer.isSingleShot() and not self._timer.isActive():
+            wait=_FRAME_MS-(time.monotonic()-self._last_pump)*1000
+            self._timer.start(max(0,int(wait)))
+
     def _pump(self):
+        # re-arm the notifier even if handling raises (e.g. OSError from the CSV log)
+        try: self._drain()
+        finally:
+            self._last_pump=time.monotonic()
+            if self._rx_notify: self._rx_notify.setEnabled(True)
+
+    def _drain(self):
+        # drain everything first, then redraw once with the newest frame
+        raws:List[str]=[]; last:Optional[PointFrame]=None
         try:
-            while True:
-                typ,payload=self._q.get_nowait()
-                if typ=='raw': self._serial_in.append(payload)
-                else:          self._handle_obj(payload)
-        except queue.Empty: pass
+            while self._rx.poll():
+                batch=self._rx.recv()
+                if isinstance(batch,str): QMessageBox.critical(self,"Serial",f"❌ {batch}"); self.close(); return
+                raws.extend(batch[0])
+                for f,vals in unpack_batch(batch,self._frame): self._ingest(f,vals); last=f
+        except EOFError:        # reader process has exited — stop watching the pipe
+            if self._rx_notify: self._rx_notify.setEnabled(False); self._rx_notify=None
+        if raws: self._serial_in.append("\n".join(raws))
+        if last is not None: self._render(last)
+        if self._ts_dirty: self._ts_dirty=False; self._refresh_ts_plot()   # at most once per tick
 
     # ---------- incoming PointFrame -----------------------------------
-    def _handle_obj(self,f:PointFrame):
-        self._draw(f); self._update_tables(f); self._store_ts(f); self._refresh_ts_plot(); self._log(f)
+    def _ingest(self,f:PointFrame,vals:Optional[List[float]]=None):  # every frame: buffers + CSV
+        self._store_ts(f,vals); self._log(f)
+    def _render(self,f:PointFrame):  # only what is visible
+        self._draw(f); self._update_tables(f)
 
     # ---------- XY drawing --------------------------------------------
     def _draw(self,f:PointFrame):
-        self._scatter.setData([{'pos':(x,y),'brush':'r' if i==0 else 'b'} for i,(x,y) in enumerate(f.coords)])
+        n=len(f.coords)
+        if len(self._brush_arr)<n:
+            self._brush_arr=np.array([self._brush_red]+[self._brush_blue]*(n-1),dtype=object)
+        self._scatter.setData(x=f.coords[:,0],y=f.coords[:,1],brush=self._brush_arr[:n])
         total=len(f.coords)+len(self._fixed_pts)
-        while len(self._labels)<total:
-            lab=pg.TextItem(anchor=(0.5,-0.3),color=self._lbl_color); self._plot.addItem(lab); self._labels.append(lab)
-        for i,(x,y) in enumerate(f.coords,1):
-            self._labels[i-1].setText(self._custom_lbl.get(i-1,str(i))); self._labels[i-1].setPos(x,y); self._labels[i-1].show()
-        for j,(fx,fy) in enumerate(self._fixed_pts,start=len(f.coords)+1):
-            self._labels[j-1].setText(self._custom_lbl.get(j-1,str(j))); self._labels[j-1].setPos(fx,fy); self._labels[j-1].show()
-        for k in range(total,len(self._labels)): self._labels[k].hide()
-        self._fixed_scatter.setData(pos=np.asarray(self._fixed_pts).reshape(-1,2)) if self._fixed_pts else self._fixed_scatter.clear()
+        while len(self._labels)<total:  # grow in blocks of 8 → fewer scene-graph inserts
+            for _ in range(8):
+                lab=pg.TextItem(anchor=(0.5,-0.3),color=self._lbl_color); lab.setVisible(False)
+                self._plot.addItem(lab); self._labels.append(lab); self._lbl_state.append(None)
+        for i,(x,y) in enumerate(itertools.chain(f.coords.tolist(),self._fixed_pts)):
+            lab,old,st=self._labels[i],self._lbl_state[i],(self._custom_lbl.get(i,str(i+1)),x,y)
+            if st!=old:   # touch Qt only when text or position changed
+                if old is None or old[0]!=st[0]: lab.setText(st[0])
+                lab.setPos(x,y); self._lbl_state[i]=st
+            if not lab.isVisible(): lab.setVisible(True)
+        for lab in self._labels[total:]:
+            if lab.isVisible(): lab.setVisible(False)
         while len(self._line_items)<len(self._conn_pairs):
             li=pg.PlotDataItem(pen=pg.mkPen('b',width=5)); self._plot.addItem(li); self._line_items.append(li)
-        px=[p[0] for p in f.coords]+[p[0] for p in self._fixed_pts]
-        py=[p[1] for p in f.coords]+[p[1] for p in self._fixed_pts]
+        all_xy=np.vstack((f.coords,self._fixed_arr)) if self._fixed_arr.size else f.coords
         for k,(a,b) in enumerate(self._conn_pairs):
-            if a<=len(px) and b<=len(px): self._line_items[k].setData([px[a-1],px[b-1]],[py[a-1],py[b-1]])
+            if a<=len(all_xy) and b<=len(all_xy): ab=all_xy[[a-1,b-1]]; self._line_items[k].setData(ab[:,0],ab[:,1])
             else: self._line_items[k].clear()
 
     # ---------- live tables -------------------------------------------
     def _update_tables(self,f:PointFrame):
-        # Points
-        n=len(f.coords)+len(self._fixed_pts); self._tbl_pts.blockSignals(True)
-        self._tbl_pts.setRowCount(n); self._tbl_pts.clearContents()
-        for i,(x,y) in enumerate(f.coords):
-            self._tbl_pts.setItem(i,0,QTableWidgetItem(self._custom_lbl.get(i,f"P{i+1}")))
-            self._tbl_pts.setItem(i,1,QTableWidgetItem(f"{x:+.3f}")); self._tbl_pts.setItem(i,2,QTableWidgetItem(f"{y:+.3f}"))
-        off=len(f.coords)
-        for j,(x,y) in enumerate(self._fixed_pts,start=off):
-            self._tbl_pts.setItem(j,0,QTableWidgetItem(self._custom_lbl.get(j,f"P{j+1}")))
-            self._tbl_pts.setItem(j,1,QTableWidgetItem(f"{x:+.3f}")); self._tbl_pts.setItem(j,2,QTableWidgetItem(f"{y:+.3f}"))
-        self._tbl_pts.blockSignals(False)
+        # Points — rows/items are reused, only changed text is pushed to Qt
+        tp=self._tbl_pts; n=len(f.coords)+len(self._fixed_pts); tp.blockSignals(True)
+        if tp.rowCount()!=n: tp.setRowCount(n)
+        for i,(x,y) in enumerate(itertools.chain(f.coords.tolist(),self._fixed_pts)):
+            self._set_cell(tp,i,0,self._custom_lbl.get(i,f"P{i+1}"))
+            self._set_cell(tp,i,1,f"{x:+.3f}"); self._set_cell(tp,i,2,f"{y:+.3f}")
+        tp.blockSignals(False)
 
         # Extra single row
-        cols=len(f.extra)
-        if self._tbl_ex.columnCount()<cols:
+        cols,have=len(f.extra),self._tbl_ex.columnCount()
+        if have<cols:
             self._tbl_ex.setColumnCount(cols)
-            hdrs=[f"D{i+1}" for i in range(cols)]
-            self._tbl_ex.setHorizontalHeaderLabels(hdrs)
-            for h in hdrs[self._ts_list.count():]:
-                chk=QListWidgetItem(h); chk.setFlags(chk.flags()|Qt.ItemIsUserCheckable); chk.setCheckState(Qt.Unchecked)
+            for c in range(have,cols): self._tbl_ex.setHorizontalHeaderItem(c,QTableWidgetItem(f"D{c+1}"))  # keeps renamed headers
+            for c in range(self._ts_list.count(),cols):
+                chk=QListWidgetItem(f"D{c+1}"); chk.setFlags(chk.flags()|Qt.ItemIsUserCheckable); chk.setCheckState(Qt.Unchecked)
                 self._ts_list.addItem(chk)
         if self._tbl_ex.rowCount()!=1: self._tbl_ex.setRowCount(1)
-        self._tbl_ex.clearContents()
-        for c,tok in enumerate(f.extra): self._tbl_ex.setItem(0,c,QTableWidgetItem(tok))
+        for c in range(self._tbl_ex.columnCount()): self._set_cell(self._tbl_ex,0,c,f.extra[c] if c<cols else "")
+
+    @staticmethod
+    def _set_cell(tbl:QTableWidget,r:int,c:int,txt:str):
+        it=tbl.item(r,c)
+        if it is None:
+            if txt: tbl.setItem(r,c,QTableWidgetItem(txt))
+        elif it.text()!=txt: it.setText(txt)
 
     # ---------- time-series buffers -----------------------------------
-    def _store_ts(self,f:PointFrame,MAX=10000):
+    def _store_ts(self,f:PointFrame,vals:Optional[List[float]]=None):
+        # vals: f.extra already as floats (NaN if non-numeric), from the reader batch
         t=f.ts_ms/1000 if getattr(f,"ts_ms",None) not in (None,0) else time.time()
-        self._ts_time.append(t)
-        for col,tok in enumerate(f.extra):
-            try: val=float(tok)
-            except ValueError: val=np.nan
-            self._ts_data.setdefault(col,[]).append(val)
-        for lst in self._ts_data.values():
-            if len(lst)<len(self._ts_time): lst.append(np.nan)
-        if len(self._ts_time)>MAX:
-            self._ts_time=self._ts_time[-MAX:];  # trim all lists equally
-            for col in self._ts_data: self._ts_data[col]=self._ts_data[col][-MAX:]
+        if vals is None: vals=[_float_or_nan(tok) for tok in f.extra]
+        pos=self._ts_pos; self._ts_time[pos]=t
+        for col in range(len(self._ts_data),len(vals)): self._ts_data[col]=np.full(self._ts_cap,np.nan)
+        for col,buf in self._ts_data.items():
+            buf[pos]=vals[col] if col<len(vals) else np.nan   # NaN if missing in this frame
+        self._ts_pos=(pos+1)%self._ts_cap; self._ts_count=min(self._ts_count+1,self._ts_cap)
+        self._ts_dirty_cols.update(self._ts_data); self._ts_dirty=True   # x-window moved for every curve
+
+    def _ts_linear(self,buf:np.ndarray)->np.ndarray:
+        # ring buffer → oldest-to-newest array (copy only once wrapped)
+        if self._ts_count<self._ts_cap: return buf[:self._ts_count]
+        return np.concatenate((buf[self._ts_pos:],buf[:self._ts_pos]))
+
+    # ---------- rolling mean over the plotted window -------------------
+    @staticmethod
+    def _rolling_mean(t:np.ndarray,data:np.ndarray,win:int):
+        # mean of the last `win` samples at each point; the windows are strided
+        # views into the (already sliced) plot data, reduced in C, NaNs ignored
+        if win<2 or len(data)<win: return t[:0],data[:0]
+        w=np.lib.stride_tricks.sliding_window_view(data,win)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore',RuntimeWarning)   # all-NaN windows → NaN
+            return t[win-1:],np.nanmean(w,axis=-1)
+
+    def _mark_ts_dirty(self,*_): self._ts_dirty=True; self._schedule_pump()
 
     # ---------- efficient redraw (last 10 s) ---------------------------
     def _refresh_ts_plot(self,*_):
-        if not self._ts_time: return
-        t_end=self._ts_time[-1]; t_start=t_end-10.0  # last 10 s
-        idx=bisect.bisect_left(self._ts_time,t_start)
-        t_slice=self._ts_time[idx:]
-
+        if not self._ts_count: return
         checked={i for i in range(self._ts_list.count())
                  if self._ts_list.item(i).checkState()==Qt.Checked and i in self._ts_data}
-
-        # add / update
-        for col in checked:
+        todo={c for c in checked if c in self._ts_dirty_cols or c not in self._ts_curves}
+
+        # add / update (only curves that are stale or new)
+        if todo:
+            t=self._ts_linear(self._ts_time)
+            idx=int(np.searchsorted(t,t[-1]-10.0))  # last 10 s
+            t_slice=np.ascontiguousarray(t[idx:])   # shared by every curve
+        for col in todo:
             if col not in self._ts_curves:
-                self._ts_curves[col]=self._ts_plot.plot(pen=next(_COLORS),name=self._ts_list.item(col).text())
+                self._ts_curves[col]=self._ts_plot.plot(pen=_COLORS[col%len(_COLORS)],name=self._ts_list.item(col).text())
             scale=self._ts_scale.get(col,1.0)
-            data=np.asarray(self._ts_data[col][idx:])*scale
+            data=self._ts_linear(self._ts_data[col])[idx:]*scale
             self._ts_curves[col].setData(t_slice,data)
-
-        # remove unchecked
-        for col in list(self._ts_curves):
-            if col not in checked:
-                self._ts_plot.removeItem(self._ts_curves[col]); del self._ts_curves[col]
+            mt,mv=self._rolling_mean(t_slice,data,self._mean_spin.value())
+            mc=self._ts_mean_curves.get(col)
+            if mc is None and len(mv):
+                mc=self._ts_mean_curves[col]=self._ts_plot.plot(pen=pg.mkPen(_COLORS[col%len(_COLORS)],style=Qt.DashLine))
+            if mc is not None: mc.setData(mt,mv)
+        self._ts_dirty_cols-=todo
+
+        # show checked / hide unchecked — curves are kept alive for re-checking
+        for col,curve in itertools.chain(self._ts_curves.items(),self._ts_mean_curves.items()):
+            vis=col in checked
+            if curve.isVisible()!=vis: curve.setVisible(vis)
 
     # ---------- edit scale factor -------------------------------------
     def _edit_scale(self,item:QListWidgetItem):
@@ -242,7 +302,7 @@ class SerialGui(QWidget):
         cur=self._ts_scale.get(col,1.0)
         val,ok=QInputDialog.getDouble(self,"Scale factor",f"Multiply values of '{item.text()}' by:",value=cur,decimals=6)
         if ok:
-            self._ts_scale[col]=val; item.setToolTip(f"scale ×{val}"); self._refresh_ts_plot()
+            self._ts_scale[col]=val; item.setToolTip(f"scale ×{val}"); self._ts_dirty_cols.add(col); self._mark_ts_dirty()
 
     # rename column / combo sync
     def _rename_ex_col(self,col:int):
@@ -259,32 +319,34 @@ class SerialGui(QWidget):
         idx,txt=item.row(),item.text().strip()
         if txt: self._custom_lbl[idx]=txt; self._labels[idx].setText(txt)
 
-    # CSV logging (unchanged) ------------------------------------------
+    # CSV logging (buffered, flushed every _LOG_FLUSH_EVERY frames) ----
     def _toggle_log(self):
         if self._csv_pts:
-            self._csv_pts.close(); self._csv_ex.close(); self._csv_pts=self._csv_ex=None
+            self._csv_pts.close(); self._csv_ex.close(); self._csv_pts=self._csv_ex=self._csv_w_pts=None
             self._log_btn.setText("Start Log → CSV"); QMessageBox.information(self,"Log","CSV files closed."); return
         base,ok=QFileDialog.getSaveFileName(self,"CSV base",".","CSV (*.csv)")
         if not ok: return
         b=Path(base).with_suffix("")
-        self._csv_pts=open(b.with_name(b.name+"_points.csv"),"a",buffering=1)
-        self._csv_ex =open(b.with_name(b.name+"_extra.csv" ),"a",buffering=1)
-        if self._csv_pts.tell()==0: self._csv_pts.write("label,x,y\n")
+        self._csv_pts=open(b.with_name(b.name+"_points.csv"),"a",buffering=_LOG_BUF)
+        self._csv_ex =open(b.with_name(b.name+"_extra.csv" ),"a",buffering=_LOG_BUF)
+        self._csv_w_pts=csv.writer(self._csv_pts,lineterminator="\n")
+        if self._csv_pts.tell()==0: self._csv_w_pts.writerow(("label","x","y"))
+        self._log_frames=0
         self._log_btn.setText("Stop Log")
 
     def _log(self,f:PointFrame):
         if not self._csv_pts: return
-        for i,(x,y) in enumerate(f.coords):
-            self._csv_pts.write(f"{self._custom_lbl.get(i,f'P{i+1}')},{x},{y}\n")
-        base=len(f.coords)
-        for j,(x,y) in enumerate(self._fixed_pts,start=base):
-            self._csv_pts.write(f"{self._custom_lbl.get(j,f'P{j+1}')},{x},{y}\n")
-        self._csv_ex.write(",".join(f.extra)+"\n")
+        lbl=self._custom_lbl
+        self._csv_w_pts.writerows([(lbl.get(i,f'P{i+1}'),x,y)
+                                   for i,(x,y) in enumerate(itertools.chain(f.coords.tolist(),self._fixed_pts))])
+        self._csv_ex.write(",".join(f.extra)+"\n")   # raw tokens, as received (never contain ',')
+        self._log_frames+=1
+        if self._log_frames%_LOG_FLUSH_EVERY==0: self._csv_pts.flush(); self._csv_ex.flush()
 
     # ---------- misc ---------------------------------------------------
     def _tx(self):
         s=self._tx_entry.text().strip()
-        if s: self._ser.write((s+'\n').encode()); self._last_tx.setText(s); self._tx_entry.clear()
+        if s: self._tx_q.put((s+'\n').encode()); self._last_tx.setText(s); self._tx_entry.clear()
 
     def _add_conn_pair(self):
         try: a,b=map(int,self._conn_entry.text().strip().split('-',1)); assert a>0 and b>0
@@ -295,8 +357,11 @@ class SerialGui(QWidget):
         try: x,y,*_=map(float,self._fix_entry.text().replace(';',',').split(','))
         except Exception: return self._flash(self._fix_entry)
         self._fixed_pts.append((x,y)); self._fix_entry.clear()
+        self._fixed_arr=np.asarray(self._fixed_pts,dtype=np.float64); self._fixed_scatter.setData(pos=self._fixed_arr)
 
     def _flash(self,w): w.setStyleSheet("background:#ffb"); QTimer.singleShot(600,lambda:w.setStyleSheet(""))
     def closeEvent(self,e):
         if self._csv_pts: self._csv_pts.close(); self._csv_ex.close()
-        self._reader.stop(); self._reader.join(timeout=1); self._ser.close(); e.accept()
+        self._stop.set(); self._reader.join(timeout=1)
+        if self._reader.is_alive(): self._reader.terminate()
+        e.accept()
@@ -1,63 +1,206 @@
-import threading, queue, serial
-from typing import Union, List, Tuple
+import threading, queue, re, serial
+import numpy as np
+from typing import List, Optional, Union
 from data import PointFrame
 
+_D_TOKEN = re.compile(rb"(?:^|,)D(?:,|$)")    # first bare 'D' token in a frame body
+
 
 class SerialReader(threading.Thread):
 
+    READ_TIMEOUT = 0.05     # s — idle wait per loop (also the stop() latency)
+
     def __init__(self, ser: serial.Serial,
-                 out_q: "queue.Queue[Union[str, PointFrame]]"):
+                 out_q: "queue.Queue[Union[str, PointFrame]]",
+                 stop: Optional[threading.Event] = None):
         super().__init__(daemon=True)
         self._ser, self._q = ser, out_q
-        self._stop = threading.Event()
+        self._ser.timeout = self.READ_TIMEOUT
+        self._stop = stop if stop is not None else threading.Event()
 
     # ------------------------------------------------------------------ #
     def stop(self) -> None:
         self._stop.set()
 
+    # ------------------------------------------------------------------ #
+    def _read_chunk(self) -> bytes:
+        """
+        Everything currently buffered in one call.  If nothing is waiting,
+        block in the driver for the first byte (b"" after READ_TIMEOUT),
+        then grab whatever arrived with it — no busy polling while idle.
+        """
+        n = self._ser.in_waiting
+        if n:
+            return self._ser.read(n)
+        first = self._ser.read(1)
+        n = self._ser.in_waiting if first else 0
+        return first + self._ser.read(n) if n else first
+
     # ------------------------------------------------------------------ #
     def run(self) -> None:
         buf = bytearray()
         while not self._stop.is_set():
-            buf.extend(self._ser.read(self._ser.in_waiting or 1))
-            while b"\n" in buf:
-                line, _, buf = buf.partition(b"\n")
-                txt = line.decode("utf-8", errors="replace").strip()
-                self._q.put(self._parse(txt))
+            chunk = self._read_chunk()
+            if chunk:
+                buf.extend(chunk)
+            if b"\n" not in chunk:
+                continue
+            *lines, tail = bytes(buf).split(b"\n")   # one scan; bytes, not bytearray
+            buf = bytearray(tail)               # keep the partial line
+            out: List = []
+            for line in lines:
+                self._emit(line, out)
+            self._publish(out)
+
+    def _emit(self, line: bytes, out: List) -> None:
+        out.append(self._parse(line))
+
+    def _publish(self, items: List) -> None:
+        for item in items:
+            self._q.put(item)
 
     # ------------------------------------------------------------------ #
-    def _parse(self, txt: str) -> Union[str, PointFrame]:
+    def _parse(self, line: bytes) -> Union[str, PointFrame]:
         """
         Frame format (no Z)  →  P,x1,y1,x2,y2,…[,D,foo,bar]
-        Any other line is passed through verbatim.
+        Any other line is passed through verbatim (decoded).
+        Frames are parsed on the raw bytes; only the extra tokens and
+        non-frame lines are decoded.
         """
-        if not txt.startswith("P,"):
-            return txt
+        line = line.strip()
+        if not line.startswith(b"P,"):
+            return _decode(line)
 
-        tokens = txt.rstrip(",").split(",")[1:]   # drop leading 'P'
-
-        if "D" in tokens:
-            d_idx          = tokens.index("D")
-            coord_tokens   = tokens[:d_idx]
-            extra_tokens   = tokens[d_idx + 1 :]
+        body = line[2:].rstrip(b",")               # drop leading 'P,'
+        m = _D_TOKEN.search(body)
+        if m:
+            coord_part, extra_part = body[: m.start()], body[m.end() :]
+            extra_tokens = _decode(extra_part).split(",") if m.group().endswith(b",") else []
         else:
-            coord_tokens, extra_tokens = tokens, []
+            coord_part, extra_tokens = body, []
+        coord_tokens = coord_part.split(b",") if coord_part else []
 
-        # convert coord_tokens to floats
-        floats: List[float] = []
-        for tok in coord_tokens:
-            try:
-                floats.append(float(tok))
-            except ValueError:
-                return f"# non-float '{tok}' in: {txt}"
+        # convert coord_tokens to floats in one C-level pass
+        try:
+            floats = np.array(coord_tokens, dtype=np.float64)
+        except ValueError:
+            bad = next((t for t in coord_tokens if not _is_float(t)), b"?")
+            return f"# non-float '{_decode(bad)}' in: {_decode(line)}"
 
-        if len(floats) < 2:
-            return f"# no coordinate data: {txt}"
+        if floats.size < 2:
+            return f"# no coordinate data: {_decode(line)}"
 
-        # Pack into (x, y) pairs  — ignore a dangling single float if present
-        coords: List[Tuple[float, float]] = [
-            (floats[i], floats[i + 1])
-            for i in range(0, len(floats) - len(floats) % 2, 2)
-        ]
+        # Pack into (x, y) rows  — ignore a dangling single float if present
+        coords = floats[: floats.size - floats.size % 2].reshape(-1, 2)
 
         return PointFrame(ts_ms=None, coords=coords, extra=extra_tokens)
+
+
+class RawSerialReader(SerialReader):
+    """Tags output: ('raw', line) for every line, plus ('obj', frame)."""
+
+    def _emit(self, line: bytes, out: List) -> None:
+        out.append(("raw", _decode(line).strip()))
+        parsed = self._parse(line)
+        if not isinstance(parsed, str):
+            out.append(("obj", parsed))
+
+
+class _PipeReader(RawSerialReader):
+    """
+    Single producer → single consumer: one Connection.send() per chunk,
+    packed by pack_batch() so the GUI unpickles a few arrays rather than
+    one PointFrame per line.
+    """
+
+    def _publish(self, items: List) -> None:
+        if items:
+            self._q.send(pack_batch(items))
+
+
+# ---------------------------------------------------------------------- #
+def pack_batch(items: List) -> tuple:
+    """
+    One chunk of ('raw', str) / ('obj', PointFrame) items →
+    (raws, coords, counts, extras, values):
+      raws    list of raw lines
+      coords  (M, 2) float64 — every frame's points, stacked
+      counts  int32 points per frame
+      extras  list of extra-token lists, one per frame
+      values  float64 of all extra tokens, stacked (NaN if non-numeric)
+    """
+    raws = [p for t, p in items if t == "raw"]
+    frames = [p for t, p in items if t == "obj"]
+    if not frames:
+        return raws, np.empty((0, 2)), np.empty(0, dtype=np.int32), [], np.empty(0)
+    coords = np.concatenate([f.coords for f in frames])
+    counts = np.fromiter((len(f.coords) for f in frames), dtype=np.int32, count=len(frames))
+    extras = [f.extra for f in frames]
+    values = parse_floats([tok for ex in extras for tok in ex])
+    return raws, coords, counts, extras, values
+
+
+def unpack_batch(batch: tuple, pf: PointFrame):
+    """
+    Yield (pf, extra values as floats) per frame of a pack_batch() tuple.
+    The same PointFrame is refilled for every frame instead of allocating
+    one per line, so callers must be done with it before the next step;
+    after the loop it holds the batch's last frame.
+    """
+    _, coords, counts, extras, values = batch
+    vals, start, v = values.tolist(), 0, 0
+    for n, ex in zip(counts.tolist(), extras):
+        pf.coords, pf.extra = coords[start : start + n], ex
+        yield pf, vals[v : v + len(ex)]
+        start += n
+        v += len(ex)
+
+
+# ---------------------------------------------------------------------- #
+def reader_proc(port: str, baud: int, conn, tx_q, stop) -> None:
+    """
+    multiprocessing entry point — owns the port so reading and parsing
+    run on their own interpreter/GIL.  Each read chunk arrives on the
+    (send-only) pipe end `conn` as one pack_batch() tuple; a plain str
+    error message is sent if the port cannot be opened.  Bytes put on
+    tx_q are written out.
+    """
+    try:
+        ser = serial.Serial(port, baud, timeout=SerialReader.READ_TIMEOUT)
+    except serial.SerialException as e:
+        conn.send(str(e))
+        return
+
+    def _tx() -> None:
+        while not stop.is_set():
+            try:
+                ser.write(tx_q.get(timeout=0.1))
+            except queue.Empty:
+                pass
+
+    threading.Thread(target=_tx, daemon=True).start()
+    try:
+        _PipeReader(ser, conn, stop).run()   # run here, not as a thread
+    finally:
+        ser.close()
+
+
+def parse_floats(tokens) -> np.ndarray:
+    """Tokens → float64 array in one pass; non-numeric tokens become NaN."""
+    try:
+        return np.array(tokens, dtype=np.float64)
+    except ValueError:
+        return np.array([float(t) if _is_float(t) else np.nan for t in tokens],
+                        dtype=np.float64)
+
+
+def _decode(b: bytes) -> str:
+    return b.decode("utf-8", errors="replace")
+
+
+def _is_float(tok: bytes) -> bool:
+    try:
+        float(tok)
+    except ValueError:
+        return False
+    return True